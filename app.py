@@ -1,17 +1,186 @@
-from flask import Flask, render_template, request, redirect, url_for, flash, jsonify
-from scheduler import Scheduler, Task
+from flask import Flask, Response, render_template, request, redirect, url_for, flash, session
+from scheduler import Scheduler, Task, run_algorithms
 from gantt_chart import GanttChartGenerator
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from collections import OrderedDict
+import csv
+import io
 import os
 from datetime import datetime
+import hashlib
+from operator import itemgetter
 import json
+import multiprocessing
+import orjson
+import threading
 
 
 app = Flask(__name__)
 app.secret_key = 'smart_os_scheduler_secret_key_2024'
 
-scheduler = Scheduler()
+# Set SCHEDULER_DB to a file path to keep tasks across restarts
+scheduler = Scheduler(db_path=os.environ.get('SCHEDULER_DB'))
 gantt_generator = GanttChartGenerator()
 
+# CSV export layout for result rows, which only hold numbers (task rows carry user
+# text and go through csv.writer for quoting)
+_CSV_RESULT_ROW = '{},{},{},{}\n'
+
+# Average times that make up an algorithm's score
+_score_fields = itemgetter('avg_waiting_time', 'avg_turnaround_time')
+
+# Simulation results keyed by (date, task signature), least recently used first
+_sim_cache = OrderedDict()
+_sim_cache_lock = threading.Lock()
+_SIM_CACHE_SIZE = 128
+
+# Simulations currently running, so concurrent requests for the same key share one run
+_inflight = {}
+_inflight_lock = threading.Lock()
+
+# Worker processes for simulating several dates at once, created on first use
+_process_pool = None
+_process_pool_lock = threading.Lock()
+
+# Pending tasks (summed over dates) below which simulate_all runs inline. Sending tasks and
+# results between processes costs about as much as simulating them: 8 dates of 2000 tasks
+# took 336 ms serially and the pool added ~180 ms of transfer on top of the work
+_PARALLEL_MIN_TASKS = 20000
+
+
+def _task_signature(tasks):
+    """Fingerprint a task list so cached results are dropped when it changes"""
+    # Keep list order: Round Robin takes its quantum from the first task
+    fields = [(t.pid, t.arrival_time, t.burst_time, t.priority, t.scheduled_date, t.time_quantum)
+              for t in tasks]
+    return hashlib.blake2b(repr(fields).encode()).digest()
+
+
+def _cache_get(key):
+    """Return cached results for a key, or None, marking them as recently used"""
+    with _sim_cache_lock:
+        results = _sim_cache.get(key)
+        if results is not None:
+            _sim_cache.move_to_end(key)
+        return results
+
+
+def _cache_put(key, results):
+    """Cache results for a key, evicting the least recently used entries past the limit"""
+    with _sim_cache_lock:
+        _sim_cache[key] = results
+        _sim_cache.move_to_end(key)
+        while len(_sim_cache) > _SIM_CACHE_SIZE:
+            _sim_cache.popitem(last=False)
+
+
+def _run_all_algorithms_cached(date, tasks=None):
+    """Run all algorithms for a date, reusing results while its tasks are unchanged.
+    
+    Callers that already fetched the date's tasks can pass them to skip a second lookup;
+    the results are always computed from the same task list the cache key is built from.
+    """
+    if tasks is None:
+        tasks = scheduler.get_tasks_by_date(date)
+    if not tasks:
+        # Nothing to cache: the error result is cheap and any date string can be requested
+        return scheduler.run_algorithms(tasks, date)
+    key = (date, _task_signature(tasks))
+    results = _cache_get(key)
+    if results is not None:
+        return results
+    
+    # Join a simulation already running for this key, or start one
+    with _inflight_lock:
+        results = _cache_get(key)
+        if results is not None:
+            return results
+        future = _inflight.get(key)
+        is_owner = future is None
+        if is_owner:
+            future = _inflight[key] = Future()
+    
+    if not is_owner:
+        return future.result()
+    
+    try:
+        results = scheduler.run_algorithms(tasks, date)
+        _cache_put(key, results)
+        future.set_result(results)
+        return results
+    except Exception as e:
+        future.set_exception(e)
+        raise
+    finally:
+        with _inflight_lock:
+            del _inflight[key]
+
+
+def _get_process_pool():
+    """Return the shared process pool, starting it on first use"""
+    global _process_pool
+    with _process_pool_lock:
+        if _process_pool is None:
+            # Start workers from a clean server process rather than forking this
+            # multi-threaded one
+            methods = multiprocessing.get_all_start_methods()
+            context = multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+            _process_pool = ProcessPoolExecutor(max_workers=os.cpu_count() or 1, mp_context=context)
+        return _process_pool
+
+
+def _reset_process_pool():
+    """Discard a broken process pool so the next parallel run starts a fresh one"""
+    global _process_pool
+    with _process_pool_lock:
+        pool, _process_pool = _process_pool, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _sort_keys(obj):
+    """Recursively order dict keys the way jsonify's sort_keys does, so int PIDs sort numerically"""
+    if isinstance(obj, dict):
+        return {key: _sort_keys(obj[key]) for key in sorted(obj)}
+    if isinstance(obj, list):
+        return [_sort_keys(item) for item in obj]
+    return obj
+
+
+def ojsonify(obj, status=200):
+    """Serialize to a JSON response with orjson, byte-for-byte like jsonify's compact output"""
+    # Sort before stringifying keys (OPT_SORT_KEYS would order "12" before "2"), and keep
+    # jsonify's trailing newline
+    body = orjson.dumps(_sort_keys(obj), option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+    return Response(body, status=status, mimetype='application/json')
+
+
+def _not_modified(etag):
+    """Return a 304 response if the client already has this version of the page, else None"""
+    # Pending flash messages must still be rendered, so never short-circuit those
+    if request.if_none_match.contains(etag) and '_flashes' not in session:
+        return _with_cache_headers(Response(status=304), etag)
+    return None
+
+
+def _with_cache_headers(response, etag):
+    """Tag a response so browsers revalidate it with If-None-Match before reuse"""
+    response.set_etag(etag)
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+    return response
+
+
+def _invalidate_sim_cache(date=None):
+    """Drop cached results for a date, or for every date when none is given"""
+    with _sim_cache_lock:
+        if date is None:
+            _sim_cache.clear()
+            return
+        for key in [key for key in _sim_cache if key[0] == date]:
+            del _sim_cache[key]
+
 
 @app.route('/')
 def index():
@@ -37,8 +206,7 @@ def add_task():
             return redirect(url_for('index'))
         
         # Check if PID already exists for the same date
-        existing_tasks = scheduler.get_tasks_by_date(scheduled_date)
-        if any(p.pid == pid for p in existing_tasks):
+        if scheduler.has_task(pid, scheduled_date):
             flash(f'Task ID {pid} already exists for date {scheduled_date}.', 'error')
             return redirect(url_for('index'))
         
@@ -53,6 +221,7 @@ def add_task():
         )
         
         scheduler.add_task(task)
+        _invalidate_sim_cache(scheduled_date)
         flash(f'Task P{pid} added successfully for {scheduled_date}!', 'success')
         
     except ValueError as e:
@@ -66,23 +235,29 @@ def add_task():
 @app.route('/view_tasks')
 def view_tasks():
     """View all tasks grouped by date"""
+    etag = _task_signature(scheduler.tasks).hex()
+    not_modified = _not_modified(etag)
+    if not_modified:
+        return not_modified
+    
     # Group tasks by date
-    tasks_by_date = {}
-    for task in scheduler.tasks:
-        date = task.scheduled_date
-        if date not in tasks_by_date:
-            tasks_by_date[date] = []
-        tasks_by_date[date].append(task)
+    tasks_by_date = scheduler.get_tasks_grouped_by_date()
     
     # Sort dates
     sorted_dates = sorted(tasks_by_date.keys())
     
     total_tasks = len(scheduler.tasks)
     
-    return render_template('view_tasks.html', 
-                         tasks_by_date=tasks_by_date,
-                         sorted_dates=sorted_dates,
-                         total_tasks=total_tasks)
+    # Rendering consumes pending flashes, so check for them first: a page showing one
+    # must not be revalidated, or a later reload would get a 304 and show it again
+    has_flashes = '_flashes' in session
+    response = app.make_response(render_template('view_tasks.html', 
+                                                 tasks_by_date=tasks_by_date,
+                                                 sorted_dates=sorted_dates,
+                                                 total_tasks=total_tasks))
+    if has_flashes:
+        return response
+    return _with_cache_headers(response, etag)
 
 
 @app.route('/simulate/<date>')
@@ -97,17 +272,19 @@ def simulate_date(date):
             return redirect(url_for('view_tasks'))
         
         # Run all algorithms
-        results = scheduler.run_all_algorithms(date)
+        results = _run_all_algorithms_cached(date, tasks)
         
-        # Generate Gantt charts (HTML-based)
+        # Generate Gantt charts (HTML-based), linking their stylesheet ahead of the first one
         gantt_charts = {}
+        stylesheet = gantt_generator.stylesheet_link(url_for('static', filename='gantt.css'))
         for algorithm_name, result in results.items():
             if isinstance(result, dict) and 'gantt_data' in result:
-                gantt_charts[algorithm_name] = gantt_generator.generate_gantt_chart_html(
+                gantt_charts[algorithm_name] = stylesheet + gantt_generator.generate_gantt_chart_html(
                     result['gantt_data'], 
                     result['algorithm'], 
                     tasks
                 )
+                stylesheet = ''
         
         # Generate comparison chart
         comparison_chart = gantt_generator.generate_comparison_chart_html(results, date)
@@ -133,12 +310,36 @@ def simulate_all():
             return redirect(url_for('view_tasks'))
         
         # Get all unique dates
-        dates = list(set(p.scheduled_date for p in scheduler.tasks))
-        dates.sort()
+        tasks_by_date = scheduler.get_tasks_grouped_by_date()
+        dates = sorted(tasks_by_date)
         
+        # Serve cached dates directly and collect the ones that need simulating
         all_results = {}
+        pending = []
         for date in dates:
-            all_results[date] = scheduler.run_all_algorithms(date)
+            tasks = tasks_by_date[date]
+            key = (date, _task_signature(tasks))
+            all_results[date] = _cache_get(key)
+            if all_results[date] is None:
+                pending.append((key, tasks))
+        
+        # Dates are independent, so large workloads are simulated in parallel
+        computed = None
+        pending_total = sum(len(tasks) for _, tasks in pending)
+        if len(pending) > 1 and (os.cpu_count() or 1) > 1 and pending_total >= _PARALLEL_MIN_TASKS:
+            pending_dates = [key[0] for key, _ in pending]
+            pending_tasks = [tasks for _, tasks in pending]
+            try:
+                computed = list(_get_process_pool().map(run_algorithms, pending_tasks, pending_dates))
+            except BrokenProcessPool:
+                # A worker died; replace the pool next time and finish this request inline
+                _reset_process_pool()
+        if computed is None:
+            computed = [run_algorithms(tasks, key[0]) for key, tasks in pending]
+        
+        for (key, _), results in zip(pending, computed):
+            _cache_put(key, results)
+            all_results[key[0]] = results
         
         # Calculate algorithm performance stats to avoid logic in template
         algorithm_stats = {}
@@ -147,19 +348,22 @@ def simulate_all():
             if best_algo and best_algo != "No valid results" and best_algo in date_results:
                 result = date_results[best_algo]
                 if 'algorithm' in result:
-                    if best_algo not in algorithm_stats:
-                        algorithm_stats[best_algo] = {
+                    stats = algorithm_stats.get(best_algo)
+                    if stats is None:
+                        stats = algorithm_stats[best_algo] = {
                             'wins': 0, 
                             'best_score': float('inf'),
                             'name': result['algorithm']
                         }
                     
-                    algorithm_stats[best_algo]['wins'] += 1
+                    stats['wins'] += 1
                     
-                    score = result.get('avg_waiting_time', 0) + result.get('avg_turnaround_time', 0)
-                    if score < algorithm_stats[best_algo]['best_score']:
-                        algorithm_stats[best_algo]['best_score'] = score
-
+                    # The best algorithm always has both averages
+                    waiting_time, turnaround_time = _score_fields(result)
+                    score = waiting_time + turnaround_time
+                    if score < stats['best_score']:
+                        stats['best_score'] = score
+        
         return render_template('all_results.html',
                              dates=dates,
                              all_results=all_results,
@@ -174,11 +378,8 @@ def simulate_all():
 def delete_task(pid, date):
     """Delete a specific task"""
     try:
-        tasks = scheduler.get_tasks_by_date(date)
-        task_to_delete = next((p for p in tasks if p.pid == pid), None)
-        
-        if task_to_delete:
-            scheduler.tasks.remove(task_to_delete)
+        if scheduler.remove_task(pid, date):
+            _invalidate_sim_cache(date)
             flash(f'Task P{pid} deleted successfully.', 'success')
         else:
             flash(f'Task P{pid} not found for date {date}.', 'error')
@@ -194,6 +395,7 @@ def clear_all():
     """Clear all tasks"""
     try:
         scheduler.clear_tasks()
+        _invalidate_sim_cache()
         flash('All tasks cleared successfully.', 'success')
     except Exception as e:
         flash(f'Error clearing tasks: {str(e)}', 'error')
@@ -205,41 +407,47 @@ def clear_all():
 def export_csv(date):
     """Export results to CSV format (simplified version)"""
     try:
-        results = scheduler.run_all_algorithms(date)
         tasks = scheduler.get_tasks_by_date(date)
         
         if not tasks:
             flash(f'No tasks found for date {date}.', 'error')
             return redirect(url_for('view_tasks'))
         
-        # Create simple CSV content
-        csv_content = []
-        csv_content.append("Task Information")
-        csv_content.append("PID,Arrival Time,Burst Time,Priority,Scheduled Date")
-        
-        for task in tasks:
-            csv_content.append(f"{task.pid},{task.arrival_time},{task.burst_time},{task.priority},{task.scheduled_date}")
-        
-        csv_content.append("")
+        # Usually already cached by viewing the date's results page
+        results = _run_all_algorithms_cached(date, tasks)
         
-        # Add algorithm results
-        for algorithm_name, result in results.items():
-            if isinstance(result, dict) and 'algorithm' in result:
-                csv_content.append(f"Algorithm: {result['algorithm']}")
-                csv_content.append("PID,Completion Time,Waiting Time,Turnaround Time")
-                
-                for task in tasks:
-                    if task.pid in result.get('completion_times', {}):
-                        csv_content.append(f"{task.pid},{result['completion_times'][task.pid]},{result['waiting_times'][task.pid]},{result['turnaround_times'][task.pid]}")
-                
-                csv_content.append(f"Average Waiting Time,{result.get('avg_waiting_time', 'N/A')}")
-                csv_content.append(f"Average Turnaround Time,{result.get('avg_turnaround_time', 'N/A')}")
-                csv_content.append("")
+        def generate_sections():
+            """Yield the CSV one section at a time so the full file is never held in memory"""
+            yield "Task Information\nPID,Arrival Time,Burst Time,Priority,Scheduled Date\n"
+            
+            # Arrival time and date come from form input, so let csv quote them as needed
+            buffer = io.StringIO()
+            writer = csv.writer(buffer, lineterminator='\n')
+            writer.writerows([task.pid, task.arrival_time, task.burst_time, task.priority, task.scheduled_date]
+                             for task in tasks)
+            yield buffer.getvalue()
+            yield "\n"
+            
+            # Add algorithm results
+            for algorithm_name, result in results.items():
+                if isinstance(result, dict) and 'algorithm' in result:
+                    completion_times = result.get('completion_times', {})
+                    waiting_times = result['waiting_times']
+                    turnaround_times = result['turnaround_times']
+                    rows = ''.join(
+                        _CSV_RESULT_ROW.format(task.pid, completion_times[task.pid],
+                                               waiting_times[task.pid], turnaround_times[task.pid])
+                        for task in tasks if task.pid in completion_times
+                    )
+                    yield (f"Algorithm: {result['algorithm']}\n"
+                           "PID,Completion Time,Waiting Time,Turnaround Time\n"
+                           f"{rows}"
+                           f"Average Waiting Time,{result.get('avg_waiting_time', 'N/A')}\n"
+                           f"Average Turnaround Time,{result.get('avg_turnaround_time', 'N/A')}\n\n")
         
-        # Create response
-        from flask import Response
+        # Stream the response
         return Response(
-            '\n'.join(csv_content),
+            generate_sections(),
             mimetype='text/csv',
             headers={'Content-Disposition': f'attachment; filename=scheduler_results_{date}.csv'}
         )
@@ -261,6 +469,11 @@ def api_tasks_by_date(date):
     """API endpoint to get tasks by date"""
     try:
         tasks = scheduler.get_tasks_by_date(date)
+        etag = _task_signature(tasks).hex()
+        not_modified = _not_modified(etag)
+        if not_modified:
+            return not_modified
+        
         task_list = []
         
         for task in tasks:
@@ -273,17 +486,23 @@ def api_tasks_by_date(date):
                 'time_quantum': task.time_quantum
             })
         
-        return jsonify({'tasks': task_list, 'date': date})
+        return _with_cache_headers(ojsonify({'tasks': task_list, 'date': date}), etag)
     
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return ojsonify({'error': str(e)}, 500)
 
 
 @app.route('/api/simulate/<date>')
 def api_simulate_date(date):
     """API endpoint to simulate algorithms for a date"""
     try:
-        results = scheduler.run_all_algorithms(date)
+        tasks = scheduler.get_tasks_by_date(date)
+        etag = _task_signature(tasks).hex()
+        not_modified = _not_modified(etag)
+        if not_modified:
+            return not_modified
+        
+        results = _run_all_algorithms_cached(date, tasks)
         
         # Remove gantt_data from API response to reduce size
         api_results = {}
@@ -295,10 +514,10 @@ def api_simulate_date(date):
             else:
                 api_results[key] = value
         
-        return jsonify(api_results)
+        return _with_cache_headers(ojsonify(api_results), etag)
     
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return ojsonify({'error': str(e)}, 500)
 
 
 @app.errorhandler(404)
@@ -316,4 +535,10 @@ if __name__ == '__main__':
     os.makedirs('static', exist_ok=True)
     os.makedirs('static/charts', exist_ok=True)
     
-    app.run(debug=True, host='0.0.0.0', port=5000) 
\ No newline at end of file
+    if os.environ.get('FLASK_DEBUG'):
+        app.run(debug=True, host='0.0.0.0', port=5000)
+    else:
+        # Tasks are held in this process's memory, so serve from one process with a
+        # thread pool; large simulate_all runs spread CPU-bound work over worker processes
+        from waitress import serve
+        serve(app, host='0.0.0.0', port=5000, threads=(os.cpu_count() or 1) * 2) 
\ No newline at end of file
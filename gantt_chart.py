@@ -1,9 +1,86 @@
 
-from typing import List, Dict
+from typing import List, Dict, Tuple
+from collections import defaultdict
+from functools import lru_cache
+from html import escape
 import os
 from datetime import datetime
 
 
+# Format strings for repeated chart fragments, parsed once at import
+_TICK_FMT = '<span class="gantt-tick">{}</span>'
+
+_ROW_FMT = """
+                <div class="gantt-row">
+                    <div class="gantt-label" style="color: {color};">P{pid}</div>
+                    <div class="gantt-track">{{blocks[{row}]}}</div>
+                </div>"""
+
+_BLOCK_FMT = '<div class="gantt-block" style="left:{left:.2f}%;width:{width:.2f}%;background:{color}">P{pid}</div>'
+
+_LEGEND_FMT = """
+                        <div class="gantt-legend-item"><div class="gantt-swatch" style="background: {color};"></div>P{pid} (AT: {arrival_time}, BT: {burst_time})</div>"""
+
+_BAR_FMT = """
+                <div class="chart-bar-container" style="margin-bottom: 15px;">
+                    <div style="display: flex; align-items: center; margin-bottom: 5px;">
+                        <span style="width: 120px; font-size: 12px; font-weight: bold;">{algo}</span>
+                        <span style="font-size: 12px; color: #666;">{value:.1f} min</span>
+                    </div>
+                    <div class="progress" style="height: 25px; background: #e9ecef;">
+                        <div class="progress-bar {bar_class}" 
+                             style="width: {height}%; 
+                                    background: {gradient} !important;">
+                        </div>
+                    </div>
+                </div>
+            """
+
+
+@lru_cache(maxsize=1440)
+def _time_to_minutes(time_str: str) -> int:
+    """Convert HH:MM format to minutes since midnight (memoized, one entry per minute of day)"""
+    hours, minutes = map(int, time_str.split(':'))
+    return hours * 60 + minutes
+
+
+@lru_cache(maxsize=1440)
+def _minutes_to_time(minutes: int) -> str:
+    """Convert minutes since midnight to HH:MM format (memoized, one entry per minute of day)"""
+    hours = minutes // 60
+    mins = minutes % 60
+    return f"{hours:02d}:{mins:02d}"
+
+
+@lru_cache(maxsize=256)
+def _gantt_shell(algorithm_name: str, pid_colors: Tuple[Tuple[int, str], ...]) -> str:
+    """Build the static part of a Gantt chart as a format string.
+    
+    The skeleton only depends on the algorithm name and the processes shown,
+    so it is built once per combination. Placeholders left for the caller are
+    ``{time_labels}``, ``{blocks[i]}`` for row ``i`` and ``{legend}``.
+    """
+    title = algorithm_name.replace('{', '{{').replace('}', '}}')
+    html = f"""
+        <div class="gantt-chart-container">
+            <h5 class="text-center mb-3">{title}</h5>
+            <div class="gantt-chart">
+                <div class="gantt-timeline">
+                    <div class="gantt-label">Process</div>
+                    <div class="gantt-ticks">{{time_labels}}</div>
+                </div>"""
+    
+    for row, (pid, color) in enumerate(pid_colors):
+        html += _ROW_FMT.format(color=color, pid=pid, row=row)
+    
+    html += """
+        {legend}
+            </div>
+        </div>
+        """
+    return html
+
+
 class GanttChartGenerator:
     """Generates HTML-based Gantt charts for scheduling algorithms"""
     
@@ -20,140 +97,88 @@ class GanttChartGenerator:
     
     def _time_to_minutes(self, time_str: str) -> int:
         """Convert HH:MM format to minutes since midnight"""
-        hours, minutes = map(int, time_str.split(':'))
-        return hours * 60 + minutes
+        return _time_to_minutes(time_str)
     
     def _minutes_to_time(self, minutes: int) -> str:
         """Convert minutes since midnight to HH:MM format"""
-        hours = minutes // 60
-        mins = minutes % 60
-        return f"{hours:02d}:{mins:02d}"
+        return _minutes_to_time(minutes)
+    
+    def stylesheet_link(self, url: str) -> str:
+        """Link the shared chart stylesheet; emit it once per page, ahead of the first chart.
+        
+        Blocks only carry their position, width and color inline, so charts
+        render unstyled without it.
+        """
+        return f'<link rel="stylesheet" href="{escape(url)}">'
     
     def generate_gantt_chart_html(self, gantt_data: List[Dict], algorithm_name: str, 
                                  processes: List = None) -> str:
-
+        
         if not gantt_data:
             return self._generate_empty_chart_html(algorithm_name)
         
-        # Get unique process IDs and create positions
-        unique_pids = list(set(item['pid'] for item in gantt_data))
-        unique_pids.sort()
-        pid_positions = {pid: i for i, pid in enumerate(unique_pids)}
+        # Convert each block's times once and group blocks by process ID
+        start_times = [_time_to_minutes(item['start']) for item in gantt_data]
+        end_times = [_time_to_minutes(item['end']) for item in gantt_data]
+        by_pid = defaultdict(list)
+        for item, start_time in zip(gantt_data, start_times):
+            by_pid[item['pid']].append((start_time, item['duration']))
+        unique_pids = sorted(by_pid)
         
-        # Calculate time range
-        all_times = []
-        for item in gantt_data:
-            all_times.extend([self._time_to_minutes(item['start']), 
-                            self._time_to_minutes(item['end'])])
+        # Look up each process's color once for the whole chart
+        colors = self.colors
+        pid_colors = {pid: colors[pid % len(colors)] for pid in unique_pids}
         
-        min_time = min(all_times)
-        max_time = max(all_times)
+        # Calculate time range
+        min_time = min(start_times)
+        max_time = max(end_times)
         time_range = max_time - min_time
+        scale = 100 / time_range
         
-        # Generate time axis labels
-        time_ticks = []
+        # Generate time axis labels (integer division matches int() of the exact quotient)
         num_ticks = min(10, time_range + 1)
-        for i in range(num_ticks):
-            time_value = min_time + (i * time_range / (num_ticks - 1))
-            time_ticks.append(self._minutes_to_time(int(time_value)))
+        time_ticks = [_minutes_to_time(min_time + i * time_range // (num_ticks - 1))
+                      for i in range(num_ticks)]
         
-        # Start building HTML
-        html = f"""
-        <div class="gantt-chart-container">
-            <h5 class="text-center mb-3">{algorithm_name}</h5>
-            <div class="gantt-chart" style="position: relative; margin: 20px 0;">
-                <div class="gantt-timeline" style="display: flex; margin-bottom: 10px;">
-                    <div style="width: 100px; text-align: center; font-weight: bold;">Process</div>
-                    <div style="flex: 1; display: flex; justify-content: space-between; padding: 0 10px;">
-        """
-        
-        # Add time labels
-        for time_label in time_ticks:
-            html += f'<span style="font-size: 12px; color: #666;">{time_label}</span>'
-        
-        html += """
-                    </div>
-                </div>
-        """
+        # Time labels
+        time_labels = ''.join(map(_TICK_FMT.format, time_ticks))
         
-        # Add process rows
+        # Process execution blocks, one string per row
+        row_blocks = []
         for pid in unique_pids:
-            color = self._get_color(pid)
-            y_pos = pid_positions[pid]
-            
-            html += f"""
-                <div class="gantt-row" style="display: flex; align-items: center; margin-bottom: 5px; height: 40px;">
-                    <div style="width: 100px; text-align: center; font-weight: bold; color: {color};">
-                        P{pid}
-                    </div>
-                    <div style="flex: 1; position: relative; height: 30px; background: #f8f9fa; border-radius: 5px; margin: 0 10px;">
-            """
-            
-            # Add process execution blocks
-            for item in gantt_data:
-                if item['pid'] == pid:
-                    start_time = self._time_to_minutes(item['start'])
-                    end_time = self._time_to_minutes(item['end'])
-                    duration = item['duration']
-                    
-                    # Calculate position and width
-                    start_pos = ((start_time - min_time) / time_range) * 100
-                    width = (duration / time_range) * 100
-                    
-                    html += f"""
-                        <div class="gantt-block" 
-                             style="position: absolute; 
-                                    left: {start_pos}%; 
-                                    width: {width}%; 
-                                    height: 100%; 
-                                    background: {color}; 
-                                    border-radius: 3px; 
-                                    display: flex; 
-                                    align-items: center; 
-                                    justify-content: center; 
-                                    color: white; 
-                                    font-weight: bold; 
-                                    font-size: 11px; 
-                                    box-shadow: 0 2px 4px rgba(0,0,0,0.2);">
-                            P{pid}
-                        </div>
-                    """
-            
-            html += """
-                    </div>
-                </div>
-            """
+            color = pid_colors[pid]
+            blocks = []
+            for start_time, duration in by_pid[pid]:
+                # Calculate position and width
+                start_pos = (start_time - min_time) * scale
+                width = duration * scale
+                
+                blocks.append(_BLOCK_FMT.format(left=start_pos, width=width, color=color, pid=pid))
+            row_blocks.append(''.join(blocks))
         
         # Add legend if processes are provided
+        legend = []
         if processes:
-            html += """
-                <div class="gantt-legend" style="margin-top: 20px; padding: 10px; background: #f8f9fa; border-radius: 5px;">
-                    <h6 style="margin-bottom: 10px;">Process Details:</h6>
-                    <div style="display: flex; flex-wrap: wrap; gap: 10px;">
-            """
+            legend.append("""
+                <div class="gantt-legend">
+                    <h6>Process Details:</h6>
+                    <div class="gantt-legend-items">""")
             
             for pid in unique_pids:
-                color = self._get_color(pid)
+                color = pid_colors[pid]
                 process_info = next((p for p in processes if p.pid == pid), None)
                 if process_info:
-                    html += f"""
-                        <div style="display: flex; align-items: center; margin-right: 15px;">
-                            <div style="width: 15px; height: 15px; background: {color}; border-radius: 3px; margin-right: 5px;"></div>
-                            <span style="font-size: 12px;">P{pid} (AT: {process_info.arrival_time}, BT: {process_info.burst_time})</span>
-                        </div>
-                    """
+                    legend.append(_LEGEND_FMT.format(color=color, pid=pid,
+                                                     arrival_time=process_info.arrival_time,
+                                                     burst_time=process_info.burst_time))
             
-            html += """
+            legend.append("""
                     </div>
-                </div>
-            """
+                </div>""")
         
-        html += """
-            </div>
-        </div>
-        """
-        
-        return html
+        # Fill the cached chart skeleton in one pass
+        shell = _gantt_shell(algorithm_name, tuple(pid_colors.items()))
+        return shell.format_map({'time_labels': time_labels, 'blocks': row_blocks, 'legend': ''.join(legend)})
     
     def _generate_empty_chart_html(self, algorithm_name: str) -> str:
         """Generate an empty chart when no data is available"""
@@ -187,76 +212,42 @@ class GanttChartGenerator:
             avg_waiting_times.append(result['avg_waiting_time'])
             avg_turnaround_times.append(result['avg_turnaround_time'])
         
-        # Find maximum values for scaling
-        max_waiting = max(avg_waiting_times) if avg_waiting_times else 1
-        max_turnaround = max(avg_turnaround_times) if avg_turnaround_times else 1
-        
         # Start building HTML
         title = f'Algorithm Performance Comparison'
         if date:
             title += f' - {date}'
         
-        html = f"""
+        waiting_bars = self._render_bars('Average Waiting Time', algorithms, avg_waiting_times,
+                                         'bg-danger', 'linear-gradient(135deg, #FF6B6B 0%, #ff4b2b 100%)')
+        turnaround_bars = self._render_bars('Average Turnaround Time', algorithms, avg_turnaround_times,
+                                            'bg-info', 'linear-gradient(135deg, #4ECDC4 0%, #45B7D1 100%)')
+        
+        return f"""
         <div class="comparison-chart-container">
             <h4 class="text-center mb-4">{title}</h4>
             <div class="row">
-                <div class="col-md-6">
-                    <h5 class="text-center mb-3">Average Waiting Time</h5>
-                    <div class="chart-container" style="height: 300px; padding: 20px;">
+                {waiting_bars}
+                {turnaround_bars}
+            </div>
+        </div>
         """
-        
-        # Generate waiting time bars
-        for i, (algo, value) in enumerate(zip(algorithms, avg_waiting_times)):
-            height_percent = (value / max_waiting) * 100 if max_waiting > 0 else 0
-            html += f"""
-                <div class="chart-bar-container" style="margin-bottom: 15px;">
-                    <div style="display: flex; align-items: center; margin-bottom: 5px;">
-                        <span style="width: 120px; font-size: 12px; font-weight: bold;">{algo}</span>
-                        <span style="font-size: 12px; color: #666;">{value:.1f} min</span>
-                    </div>
-                    <div class="progress" style="height: 25px; background: #e9ecef;">
-                        <div class="progress-bar bg-danger" 
-                             style="width: {height_percent}%; 
-                                    background: linear-gradient(135deg, #FF6B6B 0%, #ff4b2b 100%) !important;">
-                        </div>
-                    </div>
-                </div>
-            """
-        
-        html += """
-                    </div>
-                </div>
+    
+    def _render_bars(self, label: str, algorithms: List[str], values: List[float],
+                     bar_class: str, gradient: str) -> str:
+        """Render one column of horizontal bars, scaled against the largest value"""
+        max_value = max(values, default=0)
+        scale = 100 / max_value if max_value > 0 else 0
+        bars = ''.join(_BAR_FMT.format(algo=algo, value=value, height=value * scale,
+                                       bar_class=bar_class, gradient=gradient)
+                       for algo, value in zip(algorithms, values))
+        return f"""
                 <div class="col-md-6">
-                    <h5 class="text-center mb-3">Average Turnaround Time</h5>
+                    <h5 class="text-center mb-3">{label}</h5>
                     <div class="chart-container" style="height: 300px; padding: 20px;">
-        """
-        
-        # Generate turnaround time bars
-        for i, (algo, value) in enumerate(zip(algorithms, avg_turnaround_times)):
-            height_percent = (value / max_turnaround) * 100 if max_turnaround > 0 else 0
-            html += f"""
-                <div class="chart-bar-container" style="margin-bottom: 15px;">
-                    <div style="display: flex; align-items: center; margin-bottom: 5px;">
-                        <span style="width: 120px; font-size: 12px; font-weight: bold;">{algo}</span>
-                        <span style="font-size: 12px; color: #666;">{value:.1f} min</span>
-                    </div>
-                    <div class="progress" style="height: 25px; background: #e9ecef;">
-                        <div class="progress-bar bg-info" 
-                             style="width: {height_percent}%; 
-                                    background: linear-gradient(135deg, #4ECDC4 0%, #45B7D1 100%) !important;">
-                        </div>
-                    </div>
-                </div>
-            """
-        
-        html += """
+        {bars}
                     </div>
                 </div>
-            </div>
-        </div>
         """
-        
-        return html
     
     def generate_gantt_chart(self, gantt_data: List[Dict], algorithm_name: str, 
                            processes: List = None) -> str:
@@ -3,9 +3,11 @@ Sample Data Generator for Smart OS Scheduler
 Generates sample tasks for testing the application
 """
 
-from scheduler import Task, Scheduler
+from scheduler import Task, Scheduler, TIME_STR
 from datetime import datetime, timedelta
+import io
 import random
+import sys
 
 
 def generate_sample_data():
@@ -121,68 +123,54 @@ def generate_random_data(num_tasks=20, num_dates=5):
     base_date = datetime.now()
     dates = [(base_date + timedelta(days=i)).strftime('%Y-%m-%d') for i in range(num_dates)]
     
-    pid_counter = 1
+    # Draw every task's fields up front, one batch per field
+    tasks_per_date = random.choices(range(2, 7), k=num_dates)  # 2-6 tasks per date
+    total = sum(tasks_per_date)
+    arrivals = random.choices(range(9 * 60, 18 * 60), k=total)  # between 9:00 and 17:59
+    burst_times = random.choices(range(1, 16), k=total)  # 1-15 minutes
+    priorities = random.choices(range(1, 6), k=total)  # 1-5
+    time_quanta = random.choices(range(1, 5), k=total)  # 1-4
+    task_dates = [date for date, count in zip(dates, tasks_per_date) for _ in range(count)]
     
-    for date in dates:
-        # Generate 2-6 tasks per date
-        num_tasks_per_date = random.randint(2, 6)
-        
-        for i in range(num_tasks_per_date):
-            # Random arrival time between 9:00 and 17:00
-            hour = random.randint(9, 17)
-            minute = random.randint(0, 59)
-            arrival_time = f"{hour:02d}:{minute:02d}"
-            
-            # Random burst time between 1 and 15 minutes
-            burst_time = random.randint(1, 15)
-            
-            # Random priority between 1 and 5
-            priority = random.randint(1, 5)
-            
-            # Random time quantum between 1 and 4
-            time_quantum = random.randint(1, 4)
-            
-            task = Task(
-                pid=pid_counter,
-                arrival_time=arrival_time,
-                burst_time=burst_time,
-                priority=priority,
-                scheduled_date=date,
-                time_quantum=time_quantum
-            )
-            
-            scheduler.add_task(task)
-            pid_counter += 1
+    for pid, (date, arrival, burst_time, priority, time_quantum) in enumerate(
+            zip(task_dates, arrivals, burst_times, priorities, time_quanta), start=1):
+        scheduler.add_task(Task(
+            pid=pid,
+            arrival_time=TIME_STR[arrival],
+            burst_time=burst_time,
+            priority=priority,
+            scheduled_date=date,
+            time_quantum=time_quantum
+        ))
     
     return scheduler
 
 
 def print_sample_data_info(scheduler):
     """Print information about the generated sample data"""
-    print("=== Sample Data Information ===")
-    print(f"Total tasks: {len(scheduler.tasks)}")
+    # Collect the report in a buffer and write it to stdout in one call
+    buf = io.StringIO()
+    write = buf.write
+    write("=== Sample Data Information ===\n")
+    write(f"Total tasks: {len(scheduler.tasks)}\n")
     
-    # Group by date
-    tasks_by_date = {}
-    for task in scheduler.tasks:
-        date = task.scheduled_date
-        if date not in tasks_by_date:
-            tasks_by_date[date] = []
-        tasks_by_date[date].append(task)
+    # Group by date, using the scheduler's date index
+    tasks_by_date = scheduler.get_tasks_grouped_by_date()
     
-    print(f"Dates: {len(tasks_by_date)}")
-    print("\nTasks by date:")
+    write(f"Dates: {len(tasks_by_date)}\n")
+    write("\nTasks by date:\n")
     for date in sorted(tasks_by_date.keys()):
         tasks = tasks_by_date[date]
-        print(f"  {date}: {len(tasks)} tasks")
+        write(f"  {date}: {len(tasks)} tasks\n")
         
         # Show task details
         for task in tasks:
-            print(f"    P{task.pid}: AT={task.arrival_time}, BT={task.burst_time}, "
-                  f"Priority={task.priority}, TQ={task.time_quantum}")
+            write(f"    P{task.pid}: AT={task.arrival_time}, BT={task.burst_time}, "
+                  f"Priority={task.priority}, TQ={task.time_quantum}\n")
     
-    print("\n=== Ready for Testing ===")
-    print("You can now run the application and test with this sample data.")
+    write("\n=== Ready for Testing ===\n")
+    write("You can now run the application and test with this sample data.\n")
+    sys.stdout.write(buf.getvalue())
 
 
 if __name__ == "__main__":
@@ -1,29 +1,77 @@
-from dataclasses import dataclass
-from typing import List, Dict, Tuple
+from dataclasses import dataclass, field
+from collections import deque
+from typing import List, Dict, Tuple, Optional, NamedTuple
 from datetime import datetime, timedelta
+from statistics import fmean
 import heapq
+import sqlite3
+import threading
 
 
-@dataclass
+# HH:MM strings for every minute of a two-day window, so schedules that run past midnight still hit the table
+TIME_STR = [f"{h:02d}:{m:02d}" for h in range(48) for m in range(60)]
+
+
+def _format_gantt(gantt_data: List[Dict]) -> List[Dict]:
+    """Convert integer start/end minutes in Gantt entries to HH:MM strings in place"""
+    size = len(TIME_STR)
+    m2t = Task._minutes_to_time
+    for entry in gantt_data:
+        start, end = entry['start'], entry['end']
+        entry['start'] = TIME_STR[start] if 0 <= start < size else m2t(start)
+        entry['end'] = TIME_STR[end] if 0 <= end < size else m2t(end)
+    return gantt_data
+
+
+def _append_slice(gantt_data: List[Dict], pid: int, start: int, end: int):
+    """Append a run of a task to the Gantt data, extending the last block if the same task continues it"""
+    if gantt_data:
+        last = gantt_data[-1]
+        if last['pid'] == pid and last['end'] == start:
+            last['end'] = end
+            last['duration'] += end - start
+            return
+    gantt_data.append({
+        'pid': pid,
+        'start': start,
+        'end': end,
+        'duration': end - start
+    })
+
+
+class Prepared(NamedTuple):
+    """Per-task fields as parallel lists indexed by input position, plus the arrival order"""
+    order: List[int]
+    pids: List[int]
+    arrivals: List[int]
+    bursts: List[int]
+    priorities: List[int]
+
+
+@dataclass(slots=True)
 class Task:
-    """Task data structure"""
+    """Task data structure (slotted: no per-instance __dict__)"""
     pid: int
     arrival_time: str  # HH:MM format
     burst_time: int    # minutes
     priority: int
     scheduled_date: str  # dd-mm-yyyy format
     time_quantum: int = 2  # for Round Robin
+    arrival_minutes: int = field(init=False, repr=False, compare=False)
     
     def __post_init__(self):
         # Convert arrival time to minutes for easier calculations
         self.arrival_minutes = self._time_to_minutes(self.arrival_time)
     
-    def _time_to_minutes(self, time_str: str) -> int:
+    @staticmethod
+    def _time_to_minutes(time_str: str) -> int:
         """Convert HH:MM format to minutes since midnight"""
-        hours, minutes = map(int, time_str.split(':'))
-        return hours * 60 + minutes
+        # Split rather than slice so single-digit hours and minutes ("9:5") still parse
+        hours, minutes = time_str.split(':')
+        return int(hours) * 60 + int(minutes)
     
-    def _minutes_to_time(self, minutes: int) -> str:
+    @staticmethod
+    def _minutes_to_time(minutes: int) -> str:
         """Convert minutes since midnight to HH:MM format"""
         hours = minutes // 60
         mins = minutes % 60
@@ -33,359 +81,419 @@ class Task:
 class Scheduler:
     """Main scheduler class containing all algorithm implementations"""
     
-    def __init__(self):
+    def __init__(self, db_path: Optional[str] = None):
         self.tasks = []
         self.results = {}
+        # Index of tasks by scheduled date, then by PID
+        self._by_date: Dict[str, Dict[int, Task]] = {}
+        # Serializes changes to the task list, index and database connection, which
+        # request threads share
+        self._lock = threading.Lock()
+        
+        # Optional SQLite store; tasks are written through to it and reloaded on start
+        self._db = None
+        if db_path:
+            self._db = sqlite3.connect(db_path, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS tasks ("
+                "pid INTEGER NOT NULL, arrival TEXT NOT NULL, burst INTEGER NOT NULL, "
+                "priority INTEGER NOT NULL, date TEXT NOT NULL, quantum INTEGER NOT NULL, "
+                "PRIMARY KEY (date, pid))"
+            )
+            self._db.commit()
+            self._load_tasks()
+    
+    def _load_tasks(self):
+        """Load persisted tasks into memory in the order they were added"""
+        rows = self._db.execute(
+            "SELECT pid, arrival, burst, priority, date, quantum FROM tasks ORDER BY rowid"
+        )
+        for pid, arrival, burst, priority, date, quantum in rows:
+            self._index_task(Task(pid, arrival, burst, priority, date, quantum))
+    
+    def _index_task(self, task: Task):
+        """Add a task to the in-memory list and date index, replacing any with the same date and PID"""
+        date_tasks = self._by_date.setdefault(task.scheduled_date, {})
+        existing = date_tasks.get(task.pid)
+        if existing is None:
+            self.tasks.append(task)
+        else:
+            self.tasks[self.tasks.index(existing)] = task
+        date_tasks[task.pid] = task
     
     def add_task(self, task: Task):
         """Add a task to the scheduler"""
-        self.tasks.append(task)
+        with self._lock:
+            self._index_task(task)
+            if self._db:
+                with self._db:
+                    self._db.execute(
+                        # Update a replaced task in place so it keeps its load order
+                        "INSERT INTO tasks (pid, arrival, burst, priority, date, quantum) "
+                        "VALUES (?, ?, ?, ?, ?, ?) "
+                        "ON CONFLICT (date, pid) DO UPDATE SET arrival = excluded.arrival, "
+                        "burst = excluded.burst, priority = excluded.priority, quantum = excluded.quantum",
+                        (task.pid, task.arrival_time, task.burst_time, task.priority,
+                         task.scheduled_date, task.time_quantum)
+                    )
+    
+    def remove_task(self, pid: int, date: str):
+        """Remove the task with the given PID from a date, returning it or None if not found"""
+        with self._lock:
+            date_tasks = self._by_date.get(date)
+            if not date_tasks or pid not in date_tasks:
+                return None
+            
+            task = date_tasks.pop(pid)
+            if not date_tasks:
+                del self._by_date[date]
+            self.tasks.remove(task)
+            if self._db:
+                with self._db:
+                    self._db.execute("DELETE FROM tasks WHERE date = ? AND pid = ?", (date, pid))
+            return task
+    
+    def has_task(self, pid: int, date: str) -> bool:
+        """Check whether a PID is already scheduled on a date"""
+        return pid in self._by_date.get(date, {})
     
     def clear_tasks(self):
         """Clear all tasks"""
-        self.tasks.clear()
-        self.results.clear()
+        with self._lock:
+            self.tasks.clear()
+            self.results.clear()
+            self._by_date.clear()
+            if self._db:
+                with self._db:
+                    self._db.execute("DELETE FROM tasks")
     
     def get_tasks_by_date(self, date: str) -> List[Task]:
         """Get all tasks for a specific date"""
-        return [t for t in self.tasks if t.scheduled_date == date]
+        return list(self._by_date.get(date, {}).values())
+    
+    def get_tasks_grouped_by_date(self) -> Dict[str, List[Task]]:
+        """Get all tasks grouped by their scheduled date"""
+        # Snapshot the index first: other request threads may add dates while this runs
+        items = list(self._by_date.items())
+        return {date: list(date_tasks.values()) for date, date_tasks in items}
+    
+    def _prepare(self, tasks: List[Task]) -> Prepared:
+        """Copy task fields into parallel lists and sort the task indices by arrival once.
+        
+        The result is read-only for the algorithms, so run_all_algorithms shares one across all of them.
+        """
+        arrivals = [t.arrival_minutes for t in tasks]
+        return Prepared(
+            order=self._sort_by_arrival(arrivals),
+            pids=[t.pid for t in tasks],
+            arrivals=arrivals,
+            bursts=[t.burst_time for t in tasks],
+            priorities=[t.priority for t in tasks]
+        )
+    
+    def _sort_by_arrival(self, arrivals: List[int]) -> List[int]:
+        """Return task indices ordered by arrival time, keeping input order for equal arrivals.
+        
+        Arrival times are minutes within a day, so large task sets are bucketed by minute
+        in O(n + 1440). Below about 3-4k tasks sorted() is faster (the bucket pass is 8x
+        slower at 300 tasks and 2x at 1000), so smaller sets, and arrivals outside the day,
+        use sorted().
+        """
+        if len(arrivals) >= 4000 and min(arrivals) >= 0 and max(arrivals) < 1440:
+            buckets = [[] for _ in range(1440)]
+            for i, arrival in enumerate(arrivals):
+                buckets[arrival].append(i)
+            return [i for bucket in buckets for i in bucket]
+        return sorted(range(len(arrivals)), key=arrivals.__getitem__)
+    
+    def _summarize(self, algorithm: str, pids: List[int], arrivals: List[int], bursts: List[int],
+                   completion: List[int], finished: List[int], gantt_data: List[Dict]) -> Dict:
+        """Build an algorithm's result from per-index completion times, keyed by PID in completion order"""
+        completion_times = {}
+        waiting_times = {}
+        turnaround_times = {}
+        
+        for i in finished:
+            pid = pids[i]
+            turnaround_time = completion[i] - arrivals[i]
+            completion_times[pid] = completion[i]
+            waiting_times[pid] = turnaround_time - bursts[i]
+            turnaround_times[pid] = turnaround_time
+        
+        avg_waiting_time = fmean(waiting_times.values())
+        avg_turnaround_time = fmean(turnaround_times.values())
+        
+        return {
+            'algorithm': algorithm,
+            'completion_times': completion_times,
+            'waiting_times': waiting_times,
+            'turnaround_times': turnaround_times,
+            'avg_waiting_time': round(avg_waiting_time, 2),
+            'avg_turnaround_time': round(avg_turnaround_time, 2),
+            'gantt_data': _format_gantt(gantt_data)
+        }
     
-    def fcfs(self, tasks: List[Task]) -> Dict:
+    def fcfs(self, tasks: List[Task], prepared: Optional[Prepared] = None) -> Dict:
         """First Come First Serve (Non-preemptive)"""
         if not tasks:
             return {"error": "No tasks to schedule"}
         
-        # Sort by arrival time
-        sorted_tasks = sorted(tasks, key=lambda x: x.arrival_minutes)
+        # Task fields and arrival order, shared when called from run_all_algorithms
+        order, pids, arrivals, bursts, _ = prepared or self._prepare(tasks)
         
-        current_time = sorted_tasks[0].arrival_minutes
-        completion_times = {}
-        waiting_times = {}
-        turnaround_times = {}
+        current_time = arrivals[order[0]]
+        completion = [0] * len(tasks)
         gantt_data = []
         
-        for task in sorted_tasks:
+        for i in order:
             # If current time is before arrival, wait
-            if current_time < task.arrival_minutes:
-                current_time = task.arrival_minutes
+            if current_time < arrivals[i]:
+                current_time = arrivals[i]
             
             # Task execution
             start_time = current_time
-            completion_time = current_time + task.burst_time
-            completion_times[task.pid] = completion_time
-            
-            # Calculate times
-            waiting_time = start_time - task.arrival_minutes
-            turnaround_time = completion_time - task.arrival_minutes
-            
-            waiting_times[task.pid] = waiting_time
-            turnaround_times[task.pid] = turnaround_time
+            current_time += bursts[i]
+            completion[i] = current_time
             
             # Gantt chart data
             gantt_data.append({
-                'pid': task.pid,
-                'start': task._minutes_to_time(start_time),
-                'end': task._minutes_to_time(completion_time),
-                'duration': task.burst_time
+                'pid': pids[i],
+                'start': start_time,
+                'end': current_time,
+                'duration': bursts[i]
             })
-            
-            current_time = completion_time
-        
-        avg_waiting_time = sum(waiting_times.values()) / len(waiting_times)
-        avg_turnaround_time = sum(turnaround_times.values()) / len(turnaround_times)
         
-        return {
-            'algorithm': 'FCFS (First Come First Serve)',
-            'completion_times': completion_times,
-            'waiting_times': waiting_times,
-            'turnaround_times': turnaround_times,
-            'avg_waiting_time': round(avg_waiting_time, 2),
-            'avg_turnaround_time': round(avg_turnaround_time, 2),
-            'gantt_data': gantt_data
-        }
+        return self._summarize('FCFS (First Come First Serve)', pids, arrivals, bursts,
+                               completion, order, gantt_data)
     
-    def sjf_non_preemptive(self, tasks: List[Task]) -> Dict:
+    def sjf_non_preemptive(self, tasks: List[Task], prepared: Optional[Prepared] = None) -> Dict:
         """Shortest Job First (Non-preemptive)"""
         if not tasks:
             return {"error": "No tasks to schedule"}
         
-        # Sort by arrival time first
-        sorted_tasks = sorted(tasks, key=lambda x: x.arrival_minutes)
+        # Task fields and arrival order, shared when called from run_all_algorithms
+        order, pids, arrivals, bursts, _ = prepared or self._prepare(tasks)
+        heappush, heappop = heapq.heappush, heapq.heappop  # bound once for the loop below
         
-        current_time = sorted_tasks[0].arrival_minutes
-        completion_times = {}
-        waiting_times = {}
-        turnaround_times = {}
+        current_time = arrivals[order[0]]
+        completion = [0] * len(tasks)
+        finished = []
         gantt_data = []
-        remaining_tasks = sorted_tasks.copy()
         
-        while remaining_tasks:
-            # Find tasks that have arrived
-            available_tasks = [t for t in remaining_tasks 
-                                 if t.arrival_minutes <= current_time]
+        # Position of the next task to arrive in the arrival order; ready entries carry
+        # their position so ties keep arrival order
+        num_tasks = len(order)
+        next_pos = 0
+        ready_heap = []
+        
+        while next_pos < num_tasks or ready_heap:
+            # Move tasks that have arrived into the ready queue
+            while next_pos < num_tasks and arrivals[order[next_pos]] <= current_time:
+                i = order[next_pos]
+                heappush(ready_heap, (bursts[i], next_pos, i))
+                next_pos += 1
             
-            if not available_tasks:
+            if not ready_heap:
                 # No task available, move time forward
-                current_time = min(t.arrival_minutes for t in remaining_tasks)
+                current_time = arrivals[order[next_pos]]
                 continue
             
             # Select shortest job among available tasks
-            selected_task = min(available_tasks, key=lambda x: x.burst_time)
+            _, _, i = heappop(ready_heap)
             
             # Task execution
             start_time = current_time
-            completion_time = current_time + selected_task.burst_time
-            completion_times[selected_task.pid] = completion_time
-            
-            # Calculate times
-            waiting_time = start_time - selected_task.arrival_minutes
-            turnaround_time = completion_time - selected_task.arrival_minutes
-            
-            waiting_times[selected_task.pid] = waiting_time
-            turnaround_times[selected_task.pid] = turnaround_time
+            current_time += bursts[i]
+            completion[i] = current_time
+            finished.append(i)
             
             # Gantt chart data
             gantt_data.append({
-                'pid': selected_task.pid,
-                'start': selected_task._minutes_to_time(start_time),
-                'end': selected_task._minutes_to_time(completion_time),
-                'duration': selected_task.burst_time
+                'pid': pids[i],
+                'start': start_time,
+                'end': current_time,
+                'duration': bursts[i]
             })
-            
-            current_time = completion_time
-            remaining_tasks.remove(selected_task)
         
-        avg_waiting_time = sum(waiting_times.values()) / len(waiting_times)
-        avg_turnaround_time = sum(turnaround_times.values()) / len(turnaround_times)
-        
-        return {
-            'algorithm': 'SJF Non-Preemptive (Shortest Job First)',
-            'completion_times': completion_times,
-            'waiting_times': waiting_times,
-            'turnaround_times': turnaround_times,
-            'avg_waiting_time': round(avg_waiting_time, 2),
-            'avg_turnaround_time': round(avg_turnaround_time, 2),
-            'gantt_data': gantt_data
-        }
+        return self._summarize('SJF Non-Preemptive (Shortest Job First)', pids, arrivals, bursts,
+                               completion, finished, gantt_data)
     
-    def sjf_preemptive(self, tasks: List[Task]) -> Dict:
+    def sjf_preemptive(self, tasks: List[Task], prepared: Optional[Prepared] = None) -> Dict:
         """Shortest Job First (Preemptive) - SRTF"""
         if not tasks:
             return {"error": "No tasks to schedule"}
         
-        # Create task copies with remaining burst time
-        task_copies = []
-        for t in tasks:
-            task_copies.append({
-                'pid': t.pid,
-                'arrival_minutes': t.arrival_minutes,
-                'burst_time': t.burst_time,
-                'remaining_burst': t.burst_time,
-                'original_task': t
-            })
+        # Task fields and arrival order, shared when called from run_all_algorithms
+        order, pids, arrivals, bursts, _ = prepared or self._prepare(tasks)
+        heappush, heappop = heapq.heappush, heapq.heappop  # bound once for the loop below
         
-        current_time = min(t['arrival_minutes'] for t in task_copies)
-        completion_times = {}
-        waiting_times = {}
-        turnaround_times = {}
+        # Remaining burst time per task index
+        remaining = list(bursts)
+        
+        current_time = arrivals[order[0]]
+        completion = [0] * len(tasks)
+        finished = []
         gantt_data = []
         
-        while any(t['remaining_burst'] > 0 for t in task_copies):
-            # Find tasks that have arrived and have remaining burst time
-            available_tasks = [t for t in task_copies 
-                                 if t['arrival_minutes'] <= current_time and t['remaining_burst'] > 0]
+        # Position of the next task to arrive in the arrival order; ready entries carry
+        # the input index so ties keep input order
+        num_tasks = len(order)
+        next_pos = 0
+        ready_heap = []
+        
+        while next_pos < num_tasks or ready_heap:
+            # Move tasks that have arrived into the ready queue
+            while next_pos < num_tasks and arrivals[order[next_pos]] <= current_time:
+                i = order[next_pos]
+                heappush(ready_heap, (remaining[i], i))
+                next_pos += 1
             
-            if not available_tasks:
+            if not ready_heap:
                 # No task available, move time forward
-                next_arrival = min(t['arrival_minutes'] for t in task_copies 
-                                 if t['remaining_burst'] > 0)
-                current_time = next_arrival
+                current_time = arrivals[order[next_pos]]
                 continue
             
             # Select task with shortest remaining burst time
-            selected_task = min(available_tasks, key=lambda x: x['remaining_burst'])
+            _, i = heappop(ready_heap)
             
-            # Execute for 1 time unit
+            # Run until the task finishes or the next arrival can preempt it
+            run_time = remaining[i]
+            if next_pos < num_tasks:
+                run_time = min(run_time, arrivals[order[next_pos]] - current_time)
             start_time = current_time
-            current_time += 1
-            selected_task['remaining_burst'] -= 1
+            current_time += run_time
+            remaining[i] -= run_time
             
             # Gantt chart data
-            gantt_data.append({
-                'pid': selected_task['pid'],
-                'start': selected_task['original_task']._minutes_to_time(start_time),
-                'end': selected_task['original_task']._minutes_to_time(current_time),
-                'duration': 1
-            })
+            _append_slice(gantt_data, pids[i], start_time, current_time)
             
-            # Check if task completed
-            if selected_task['remaining_burst'] == 0:
-                completion_time = current_time
-                completion_times[selected_task['pid']] = completion_time
-                
-                # Calculate times
-                original_task = selected_task['original_task']
-                waiting_time = completion_time - original_task.arrival_minutes - original_task.burst_time
-                turnaround_time = completion_time - original_task.arrival_minutes
-                
-                waiting_times[selected_task['pid']] = waiting_time
-                turnaround_times[selected_task['pid']] = turnaround_time
-        
-        avg_waiting_time = sum(waiting_times.values()) / len(waiting_times)
-        avg_turnaround_time = sum(turnaround_times.values()) / len(turnaround_times)
+            if remaining[i] > 0:
+                # Preempted by an arrival; requeue with the updated key
+                heappush(ready_heap, (remaining[i], i))
+                continue
+            
+            # Task completed
+            completion[i] = current_time
+            finished.append(i)
         
-        return {
-            'algorithm': 'SJF Preemptive (Shortest Remaining Time First)',
-            'completion_times': completion_times,
-            'waiting_times': waiting_times,
-            'turnaround_times': turnaround_times,
-            'avg_waiting_time': round(avg_waiting_time, 2),
-            'avg_turnaround_time': round(avg_turnaround_time, 2),
-            'gantt_data': gantt_data
-        }
+        return self._summarize('SJF Preemptive (Shortest Remaining Time First)', pids, arrivals, bursts,
+                               completion, finished, gantt_data)
     
-    def priority_non_preemptive(self, tasks: List[Task]) -> Dict:
+    def priority_non_preemptive(self, tasks: List[Task], prepared: Optional[Prepared] = None) -> Dict:
         """Priority Scheduling (Non-preemptive)"""
         if not tasks:
             return {"error": "No tasks to schedule"}
         
-        # Sort by arrival time first
-        sorted_tasks = sorted(tasks, key=lambda x: x.arrival_minutes)
+        # Task fields and arrival order, shared when called from run_all_algorithms
+        order, pids, arrivals, bursts, priorities = prepared or self._prepare(tasks)
+        heappush, heappop = heapq.heappush, heapq.heappop  # bound once for the loop below
         
-        current_time = sorted_tasks[0].arrival_minutes
-        completion_times = {}
-        waiting_times = {}
-        turnaround_times = {}
+        current_time = arrivals[order[0]]
+        completion = [0] * len(tasks)
+        finished = []
         gantt_data = []
-        remaining_tasks = sorted_tasks.copy()
         
-        while remaining_tasks:
-            # Find tasks that have arrived
-            available_tasks = [t for t in remaining_tasks 
-                                 if t.arrival_minutes <= current_time]
+        # Position of the next task to arrive in the arrival order; ready entries carry
+        # their position so ties keep arrival order
+        num_tasks = len(order)
+        next_pos = 0
+        ready_heap = []
+        
+        while next_pos < num_tasks or ready_heap:
+            # Move tasks that have arrived into the ready queue
+            while next_pos < num_tasks and arrivals[order[next_pos]] <= current_time:
+                i = order[next_pos]
+                heappush(ready_heap, (priorities[i], next_pos, i))
+                next_pos += 1
             
-            if not available_tasks:
+            if not ready_heap:
                 # No task available, move time forward
-                current_time = min(t.arrival_minutes for t in remaining_tasks)
+                current_time = arrivals[order[next_pos]]
                 continue
             
             # Select highest priority task (lowest priority number)
-            selected_task = min(available_tasks, key=lambda x: x.priority)
+            _, _, i = heappop(ready_heap)
             
             # Task execution
             start_time = current_time
-            completion_time = current_time + selected_task.burst_time
-            completion_times[selected_task.pid] = completion_time
-            
-            # Calculate times
-            waiting_time = start_time - selected_task.arrival_minutes
-            turnaround_time = completion_time - selected_task.arrival_minutes
-            
-            waiting_times[selected_task.pid] = waiting_time
-            turnaround_times[selected_task.pid] = turnaround_time
+            current_time += bursts[i]
+            completion[i] = current_time
+            finished.append(i)
             
             # Gantt chart data
             gantt_data.append({
-                'pid': selected_task.pid,
-                'start': selected_task._minutes_to_time(start_time),
-                'end': selected_task._minutes_to_time(completion_time),
-                'duration': selected_task.burst_time
+                'pid': pids[i],
+                'start': start_time,
+                'end': current_time,
+                'duration': bursts[i]
             })
-            
-            current_time = completion_time
-            remaining_tasks.remove(selected_task)
         
-        avg_waiting_time = sum(waiting_times.values()) / len(waiting_times)
-        avg_turnaround_time = sum(turnaround_times.values()) / len(turnaround_times)
-        
-        return {
-            'algorithm': 'Priority Non-Preemptive',
-            'completion_times': completion_times,
-            'waiting_times': waiting_times,
-            'turnaround_times': turnaround_times,
-            'avg_waiting_time': round(avg_waiting_time, 2),
-            'avg_turnaround_time': round(avg_turnaround_time, 2),
-            'gantt_data': gantt_data
-        }
+        return self._summarize('Priority Non-Preemptive', pids, arrivals, bursts,
+                               completion, finished, gantt_data)
     
-    def priority_preemptive(self, tasks: List[Task]) -> Dict:
+    def priority_preemptive(self, tasks: List[Task], prepared: Optional[Prepared] = None) -> Dict:
         """Priority Scheduling (Preemptive)"""
         if not tasks:
             return {"error": "No tasks to schedule"}
         
-        # Create task copies with remaining burst time
-        task_copies = []
-        for t in tasks:
-            task_copies.append({
-                'pid': t.pid,
-                'arrival_minutes': t.arrival_minutes,
-                'burst_time': t.burst_time,
-                'remaining_burst': t.burst_time,
-                'priority': t.priority,
-                'original_task': t
-            })
+        # Task fields and arrival order, shared when called from run_all_algorithms
+        order, pids, arrivals, bursts, priorities = prepared or self._prepare(tasks)
+        heappush, heappop = heapq.heappush, heapq.heappop  # bound once for the loop below
         
-        current_time = min(t['arrival_minutes'] for t in task_copies)
-        completion_times = {}
-        waiting_times = {}
-        turnaround_times = {}
+        # Remaining burst time per task index
+        remaining = list(bursts)
+        
+        current_time = arrivals[order[0]]
+        completion = [0] * len(tasks)
+        finished = []
         gantt_data = []
         
-        while any(t['remaining_burst'] > 0 for t in task_copies):
-            # Find tasks that have arrived and have remaining burst time
-            available_tasks = [t for t in task_copies 
-                                 if t['arrival_minutes'] <= current_time and t['remaining_burst'] > 0]
+        # Position of the next task to arrive in the arrival order; ready entries carry
+        # the input index so ties keep input order
+        num_tasks = len(order)
+        next_pos = 0
+        ready_heap = []
+        
+        while next_pos < num_tasks or ready_heap:
+            # Move tasks that have arrived into the ready queue
+            while next_pos < num_tasks and arrivals[order[next_pos]] <= current_time:
+                i = order[next_pos]
+                heappush(ready_heap, (priorities[i], i))
+                next_pos += 1
             
-            if not available_tasks:
+            if not ready_heap:
                 # No task available, move time forward
-                next_arrival = min(t['arrival_minutes'] for t in task_copies 
-                                 if t['remaining_burst'] > 0)
-                current_time = next_arrival
+                current_time = arrivals[order[next_pos]]
                 continue
             
             # Select task with highest priority (lowest priority number)
-            selected_task = min(available_tasks, key=lambda x: x['priority'])
+            _, i = heappop(ready_heap)
             
-            # Execute for 1 time unit
+            # Run until the task finishes or the next arrival can preempt it
+            run_time = remaining[i]
+            if next_pos < num_tasks:
+                run_time = min(run_time, arrivals[order[next_pos]] - current_time)
             start_time = current_time
-            current_time += 1
-            selected_task['remaining_burst'] -= 1
+            current_time += run_time
+            remaining[i] -= run_time
             
             # Gantt chart data
-            gantt_data.append({
-                'pid': selected_task['pid'],
-                'start': selected_task['original_task']._minutes_to_time(start_time),
-                'end': selected_task['original_task']._minutes_to_time(current_time),
-                'duration': 1
-            })
+            _append_slice(gantt_data, pids[i], start_time, current_time)
             
-            # Check if task completed
-            if selected_task['remaining_burst'] == 0:
-                completion_time = current_time
-                completion_times[selected_task['pid']] = completion_time
-                
-                # Calculate times
-                original_task = selected_task['original_task']
-                waiting_time = completion_time - original_task.arrival_minutes - original_task.burst_time
-                turnaround_time = completion_time - original_task.arrival_minutes
-                
-                waiting_times[selected_task['pid']] = waiting_time
-                turnaround_times[selected_task['pid']] = turnaround_time
-        
-        avg_waiting_time = sum(waiting_times.values()) / len(waiting_times)
-        avg_turnaround_time = sum(turnaround_times.values()) / len(turnaround_times)
+            if remaining[i] > 0:
+                # Preempted by an arrival; requeue with the updated key
+                heappush(ready_heap, (priorities[i], i))
+                continue
+            
+            # Task completed
+            completion[i] = current_time
+            finished.append(i)
         
-        return {
-            'algorithm': 'Priority Preemptive',
-            'completion_times': completion_times,
-            'waiting_times': waiting_times,
-            'turnaround_times': turnaround_times,
-            'avg_waiting_time': round(avg_waiting_time, 2),
-            'avg_turnaround_time': round(avg_turnaround_time, 2),
-            'gantt_data': gantt_data
-        }
+        return self._summarize('Priority Preemptive', pids, arrivals, bursts,
+                               completion, finished, gantt_data)
     
-    def round_robin(self, tasks: List[Task]) -> Dict:
+    def round_robin(self, tasks: List[Task], prepared: Optional[Prepared] = None) -> Dict:
         """Round Robin Scheduling"""
         if not tasks:
             return {"error": "No tasks to schedule"}
@@ -393,82 +501,59 @@ class Scheduler:
         # Use the first task's time quantum, or default to 2
         time_quantum = tasks[0].time_quantum if tasks else 2
         
-        # Create task copies with remaining burst time
-        task_copies = []
-        for t in tasks:
-            task_copies.append({
-                'pid': t.pid,
-                'arrival_minutes': t.arrival_minutes,
-                'burst_time': t.burst_time,
-                'remaining_burst': t.burst_time,
-                'original_task': t
-            })
+        # Task fields and arrival order, shared when called from run_all_algorithms
+        order, pids, arrivals, bursts, _ = prepared or self._prepare(tasks)
         
-        current_time = min(t['arrival_minutes'] for t in task_copies)
-        completion_times = {}
-        waiting_times = {}
-        turnaround_times = {}
+        # Remaining burst time per task index
+        remaining = list(bursts)
+        
+        current_time = arrivals[order[0]]
+        completion = [0] * len(tasks)
+        finished = []
         gantt_data = []
-        ready_queue = []
+        ready_queue = deque()
         
-        # Sort by arrival time
-        task_copies.sort(key=lambda x: x['arrival_minutes'])
+        # Task indices in arrival order
+        arrival_queue = deque(order)
+        enqueue, dequeue = ready_queue.append, ready_queue.popleft
         
-        while task_copies or ready_queue:
+        while arrival_queue or ready_queue:
             # Add arrived tasks to ready queue
-            while task_copies and task_copies[0]['arrival_minutes'] <= current_time:
-                ready_queue.append(task_copies.pop(0))
+            while arrival_queue and arrivals[arrival_queue[0]] <= current_time:
+                enqueue(arrival_queue.popleft())
             
             if not ready_queue:
                 # No task in ready queue, move time forward
-                current_time = task_copies[0]['arrival_minutes']
+                current_time = arrivals[arrival_queue[0]]
                 continue
             
             # Get next task from ready queue
-            current_task = ready_queue.pop(0)
+            i = dequeue()
             
             # Execute task
             start_time = current_time
-            execution_time = min(time_quantum, current_task['remaining_burst'])
+            execution_time = min(time_quantum, remaining[i])
             current_time += execution_time
-            current_task['remaining_burst'] -= execution_time
+            remaining[i] -= execution_time
             
-            # Gantt chart data
+            # Gantt chart data, one block per quantum so the time slices stay visible
             gantt_data.append({
-                'pid': current_task['pid'],
-                'start': current_task['original_task']._minutes_to_time(start_time),
-                'end': current_task['original_task']._minutes_to_time(current_time),
+                'pid': pids[i],
+                'start': start_time,
+                'end': current_time,
                 'duration': execution_time
             })
             
             # Check if task completed
-            if current_task['remaining_burst'] == 0:
-                completion_time = current_time
-                completion_times[current_task['pid']] = completion_time
-                
-                # Calculate times
-                original_task = current_task['original_task']
-                waiting_time = completion_time - original_task.arrival_minutes - original_task.burst_time
-                turnaround_time = completion_time - original_task.arrival_minutes
-                
-                waiting_times[current_task['pid']] = waiting_time
-                turnaround_times[current_task['pid']] = turnaround_time
+            if remaining[i] == 0:
+                completion[i] = current_time
+                finished.append(i)
             else:
                 # Task not completed, add back to ready queue
-                ready_queue.append(current_task)
+                enqueue(i)
         
-        avg_waiting_time = sum(waiting_times.values()) / len(waiting_times)
-        avg_turnaround_time = sum(turnaround_times.values()) / len(turnaround_times)
-        
-        return {
-            'algorithm': f'Round Robin (Time Quantum: {time_quantum})',
-            'completion_times': completion_times,
-            'waiting_times': waiting_times,
-            'turnaround_times': turnaround_times,
-            'avg_waiting_time': round(avg_waiting_time, 2),
-            'avg_turnaround_time': round(avg_turnaround_time, 2),
-            'gantt_data': gantt_data
-        }
+        return self._summarize(f'Round Robin (Time Quantum: {time_quantum})', pids, arrivals, bursts,
+                               completion, finished, gantt_data)
     
     def run_all_algorithms(self, date: str = None) -> Dict:
         """Run all scheduling algorithms for tasks on a specific date"""
@@ -477,11 +562,18 @@ class Scheduler:
         else:
             target_tasks = self.tasks
         
+        return self.run_algorithms(target_tasks, date)
+    
+    def run_algorithms(self, target_tasks: List[Task], date: str = None) -> Dict:
+        """Run all scheduling algorithms on the given tasks (date is only used in the error message)"""
         if not target_tasks:
             return {"error": f"No tasks found for date: {date}"}
         
         results = {}
         
+        # Sort and unpack the tasks once for all algorithms
+        prepared = self._prepare(target_tasks)
+        
         # Run all algorithms
         algorithms = [
             ('fcfs', self.fcfs),
@@ -492,34 +584,30 @@ class Scheduler:
             ('round_robin', self.round_robin)
         ]
         
+        # Track the best algorithm as results come in (lowest combined score, first one wins ties)
+        best_algorithm, best_score = "No valid results", float('inf')
+        
         for name, algorithm_func in algorithms:
             try:
-                results[name] = algorithm_func(target_tasks)
+                result = algorithm_func(target_tasks, prepared)
             except Exception as e:
-                results[name] = {"error": f"Error in {name}: {str(e)}"}
+                result = {"error": f"Error in {name}: {str(e)}"}
+            results[name] = result
+            
+            if 'avg_waiting_time' in result:
+                # Weight waiting time and turnaround time equally
+                score = result['avg_waiting_time'] + result['avg_turnaround_time']
+                if score < best_score:
+                    best_algorithm, best_score = name, score
         
-        # Find best algorithm
-        best_algorithm = self._find_best_algorithm(results)
         results['best_algorithm'] = best_algorithm
         
         return results
+
+
+def run_algorithms(tasks: List[Task], date: Optional[str] = None) -> Dict:
+    """Run all algorithms on a standalone scheduler, for use as a process pool worker.
     
-    def _find_best_algorithm(self, results: Dict) -> str:
-        """Find the best algorithm based on average waiting time and turnaround time"""
-        valid_results = {k: v for k, v in results.items() 
-                        if isinstance(v, dict) and 'avg_waiting_time' in v}
-        
-        if not valid_results:
-            return "No valid results"
-        
-        # Calculate combined score (lower is better)
-        algorithm_scores = {}
-        for name, result in valid_results.items():
-            # Weight waiting time and turnaround time equally
-            score = result['avg_waiting_time'] + result['avg_turnaround_time']
-            algorithm_scores[name] = score
-        
-        # Find algorithm with lowest score
-        best_algorithm = min(algorithm_scores.items(), key=lambda x: x[1])[0]
-        
-        return best_algorithm 
\ No newline at end of file
+    Lives here rather than in app.py so worker processes only import this module.
+    """
+    return Scheduler().run_algorithms(tasks, date)
\ No newline at end of file